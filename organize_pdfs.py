@@ -1,43 +1,109 @@
-import json
+import errno
+import mmap
 import os
 import shutil
 from pathlib import Path
-import glob
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
 
 DOCS_DIR = Path("docs")
 COMBINED_METADATA_OUTPUT_FILE = Path("all_metadata_combined.json") # Added for new function
+LOAD_WORKERS = min(32, (os.cpu_count() or 1) + 4) # Threads used to read metadata shards
+MMAP_THRESHOLD = 1 << 20 # Shards larger than this (bytes) are memory-mapped instead of read
+
+def _iter_metadata_files():
+    """Yields os.DirEntry objects for the metadata_page_*.json files in DOCS_DIR."""
+    with os.scandir(DOCS_DIR) as it:
+        for entry in it:
+            name = entry.name
+            if name.startswith("metadata_page_") and name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                yield entry
+
+def _loads_file(file_path: Path):
+    """Parses a JSON file, memory-mapping it instead of copying it when it is large."""
+    if file_path.stat().st_size <= MMAP_THRESHOLD:
+        return orjson.loads(file_path.read_bytes())
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
 
 def load_metadata_file(file_path: Path) -> list:
-    """Loads and parses a single JSON metadata file."""
+    """Loads and parses a single JSON metadata file, returning only its dictionary items."""
     if not file_path.exists():
         print(f"Warning: Metadata file not found at {file_path}")
         return []
-    with open(file_path, 'r', encoding='utf-8') as f:
-        try:
-            data = json.load(f)
-            if isinstance(data, list):
-                return data
-            elif isinstance(data, dict): # Handle cases where a single JSON object might be in a file meant to be part of a list
-                return [data]
-            else:
-                print(f"Warning: Metadata in {file_path} is not a list or dictionary.")
-                return []
-        except json.JSONDecodeError:
-            print(f"Error: Could not decode JSON from {file_path}")
-            return []
+    try:
+        data = _loads_file(file_path)
+    except orjson.JSONDecodeError:
+        print(f"Error: Could not decode JSON from {file_path}")
+        return []
+    if isinstance(data, list):
+        # Filter non-dictionary items once here so callers can skip per-item type checks
+        items = [item for item in data if type(item) is dict]
+        if len(items) != len(data):
+            print(f"Warning: Skipping {len(data) - len(items)} non-dictionary items in {file_path}")
+        return items
+    elif isinstance(data, dict): # Handle cases where a single JSON object might be in a file meant to be part of a list
+        return [data]
+    else:
+        print(f"Warning: Metadata in {file_path} is not a list or dictionary.")
+        return []
+
+def _shard_items_bytes(file_path: Path) -> bytes:
+    """
+    Returns the comma-separated items of a metadata shard as raw JSON bytes,
+    i.e. the shard's top-level array without its enclosing brackets.
+    """
+    if not file_path.exists():
+        print(f"Warning: Metadata file not found at {file_path}")
+        return b""
+    raw = file_path.read_bytes()
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        print(f"Error: Could not decode JSON from {file_path}")
+        return b""
+    if isinstance(data, list):
+        # Splice the original bytes rather than re-serializing the items
+        return raw.strip()[1:-1].strip()
+    elif isinstance(data, dict):
+        return orjson.dumps(data)
+    else:
+        print(f"Warning: Metadata in {file_path} is not a list or dictionary.")
+        return b""
+
+def _map_in_batches(fn, paths: list):
+    """
+    Applies fn to each path on a thread pool and yields (path, result) pairs
+    in input order. Paths are submitted one batch of LOAD_WORKERS at a time,
+    so only a handful of results is held in memory.
+    """
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+        for start in range(0, len(paths), LOAD_WORKERS):
+            batch = paths[start:start + LOAD_WORKERS]
+            yield from zip(batch, executor.map(fn, batch))
+
+def _iter_metadata_items(paths: list):
+    """Yields the metadata items of each shard in turn, loading shards in parallel."""
+    for file_path, data in _map_in_batches(load_metadata_file, paths):
+        print(f"Loading additional metadata from: {file_path}")
+        yield from data
 
 def concatenate_metadata_files(output_file_path: Path = COMBINED_METADATA_OUTPUT_FILE):
     """
     Finds all metadata_page_*.json files in DOCS_DIR,
     combines their content, and writes it to output_file_path.
+
+    Shards are streamed into the output in small batches, so only a
+    handful of shards is ever held in memory.
     """
-    all_data = []
     if not DOCS_DIR.exists() or not DOCS_DIR.is_dir():
         print(f"Error: Docs directory not found at {DOCS_DIR}. Cannot find metadata pages.")
         return
 
     metadata_files_pattern = str(DOCS_DIR / "metadata_page_*.json")
-    found_files = list(glob.glob(metadata_files_pattern))
+    found_files = [Path(entry.path) for entry in _iter_metadata_files()]
 
     if not found_files:
         print(f"No metadata files found matching pattern: {metadata_files_pattern}")
@@ -49,105 +115,142 @@ def concatenate_metadata_files(output_file_path: Path = COMBINED_METADATA_OUTPUT
 
     print(f"Found {len(found_files)} metadata page files to concatenate.")
 
-    for file_path_str in found_files:
-        file_path = Path(file_path_str)
-        print(f"Processing: {file_path}")
-        data = load_metadata_file(file_path)
-        if data: # load_metadata_file returns a list
-            all_data.extend(data)
-
     try:
-        with open(output_file_path, 'w', encoding='utf-8') as f:
-            json.dump(all_data, f, indent=4, ensure_ascii=False)
+        with open(output_file_path, 'wb') as f:
+            f.write(b"[")
+            first = True
+            for file_path, items in _map_in_batches(_shard_items_bytes, found_files):
+                print(f"Processing: {file_path}")
+                if not items:
+                    continue
+                if not first:
+                    f.write(b",")
+                f.write(items)
+                first = False
+            f.write(b"]")
         print(f"Successfully concatenated metadata to: {output_file_path}")
     except IOError as e:
         print(f"Error writing combined metadata to {output_file_path}: {e}")
     except Exception as e:
         print(f"An unexpected error occurred while writing combined metadata: {e}")
 
+def _apply_moves(docs_dir: str, moves: list) -> tuple:
+    """
+    Moves each (year, filename) pair from docs_dir into docs_dir/year and
+    returns (moved, failed) counts. Source and destination normally share a
+    filesystem, so a plain rename suffices; a year folder on another device
+    (a mount point or a symlink elsewhere) falls back to shutil.move.
+    """
+    moved = failed = 0
+    # Where supported, rename relative to open directory handles so the kernel
+    # does not resolve the full paths again for every file
+    docs_fd = None
+    if os.rename in os.supports_dir_fd:
+        try:
+            docs_fd = os.open(docs_dir, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError as e:
+            print(f"Warning: Could not open {docs_dir}, renaming by path instead: {e}")
+    year_fds = {}
+    try:
+        for year, pdf_filename in moves:
+            try:
+                try:
+                    if docs_fd is not None:
+                        if year not in year_fds:
+                            year_fds[year] = os.open(f"{docs_dir}/{year}", os.O_RDONLY | os.O_DIRECTORY)
+                        os.rename(pdf_filename, pdf_filename, src_dir_fd=docs_fd, dst_dir_fd=year_fds[year])
+                    else:
+                        os.replace(f"{docs_dir}/{pdf_filename}", f"{docs_dir}/{year}/{pdf_filename}")
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                    # The year folder lives on another filesystem, so the file has to be copied
+                    shutil.move(f"{docs_dir}/{pdf_filename}", f"{docs_dir}/{year}/{pdf_filename}")
+                # print(f"Moved: {pdf_filename} -> {year}")
+                moved += 1
+            except OSError as e:
+                print(f"Error moving file {pdf_filename} to {docs_dir}/{year}: {e}")
+                failed += 1
+    finally:
+        for fd in year_fds.values():
+            os.close(fd)
+        if docs_fd is not None:
+            os.close(docs_fd)
+    return moved, failed
+
 def organize_pdfs():
     """
     Organizes PDF files from the DOCS_DIR into year-based subfolders
     based on metadata from metadata files in DOCS_DIR.
     """
-    all_metadata = []
-
-    # Load additional metadata files from docs directory
-    if DOCS_DIR.exists() and DOCS_DIR.is_dir():
-        for metadata_page_file_path_str in glob.glob(str(DOCS_DIR / "metadata_page_*.json")):
-            metadata_page_file_path = Path(metadata_page_file_path_str)
-            print(f"Loading additional metadata from: {metadata_page_file_path}")
-            all_metadata.extend(load_metadata_file(metadata_page_file_path))
-    else:
+    if not DOCS_DIR.exists() or not DOCS_DIR.is_dir():
         print(f"Warning: Docs directory not found at {DOCS_DIR}, cannot load page-specific metadata.")
-        # If only the main metadata file is expected to exist and docs dir might not,
-        # this warning might be too strong. Adjust if necessary.
-
-    if not all_metadata:
         print("Error: No metadata loaded. Please check metadata files.")
         return
 
-    if not DOCS_DIR.exists() or not DOCS_DIR.is_dir():
-        print(f"Error: Docs directory not found at {DOCS_DIR}. Cannot move PDF files.")
-        return
-
     print(f"Organizing PDFs in {DOCS_DIR} using combined metadata...")
     moved_files = 0
     skipped_files = 0
-    processed_filenames = set() # Keep track of filenames to avoid processing duplicates if they appear in multiple metadata sources
-
-    for item in all_metadata:
-        if not isinstance(item, dict):
-            print(f"Warning: Skipping non-dictionary item in combined metadata: {item}")
-            continue
+    # List DOCS_DIR and each year folder once instead of stat-ing every source and destination
+    with os.scandir(DOCS_DIR) as it:
+        existing_files = {entry.name for entry in it if entry.is_file()}
+    year_dir_contents = {} # year -> set of filenames already in DOCS_DIR/year
+    pending_moves = [] # (year, filename) pairs, applied in one batch after planning
+    docs_str = str(DOCS_DIR) # Plain strings on the per-item path; Path construction is comparatively slow
 
+    # Stream items shard by shard and plan each move as it arrives, so only
+    # filenames are retained, never the metadata items themselves. The first
+    # entry for a PDF wins if it appears in multiple metadata sources
+    metadata_page_files = [Path(entry.path) for entry in _iter_metadata_files()]
+    loaded_items = 0
+    seen_filenames = set()
+    for item in _iter_metadata_items(metadata_page_files):
+        loaded_items += 1
         pdf_filename = item.get("downloaded_filename")
-        date_str = item.get("date")
-
         if not pdf_filename:
             print(f"Warning: Skipping item due to missing \'downloaded_filename\': {item.get('title', 'N/A')}")
             continue
-        
-        if pdf_filename in processed_filenames:
-            # print(f"Info: PDF \'{pdf_filename}\' already processed, skipping.")
-            # skipped_files +=1 # Counting as skipped might be misleading if it was successfully moved by another metadata entry
+        if pdf_filename in seen_filenames:
             continue
+        seen_filenames.add(pdf_filename)
 
+        date_str = item.get("date")
 
         if not date_str:
             print(f"Warning: Skipping item \'{pdf_filename}\' due to missing \'date\'")
             skipped_files += 1
-            processed_filenames.add(pdf_filename)
             continue
 
         try:
             # Extract year from ISO date string (e.g., "2021-02-12T00:00:00.000Z")
-            year = date_str.split('-')[0]
-            if not year.isdigit() or len(year) != 4:
+            # Same acceptance as date_str.split('-')[0]: exactly four digits before the first '-'
+            year = date_str[:4]
+            if date_str[4:5] not in ("-", "") or len(year) != 4 or not year.isdigit():
                 raise ValueError("Year format is incorrect")
-        except (IndexError, ValueError) as e:
+        except (TypeError, ValueError) as e:
             print(f"Warning: Skipping item \'{pdf_filename}\' due to invalid date format \'{date_str}\': {e}")
             skipped_files += 1
-            processed_filenames.add(pdf_filename)
             continue
 
-        source_pdf_path = DOCS_DIR / pdf_filename
-        year_dir = DOCS_DIR / year
+        year_dir = f"{docs_str}/{year}"
 
-        if not source_pdf_path.exists():
-            # print(f"Info: Source PDF not found, skipping: {source_pdf_path}")
+        if pdf_filename not in existing_files:
+            # print(f"Info: Source PDF not found, skipping: {pdf_filename}")
             skipped_files +=1
-            processed_filenames.add(pdf_filename)
             continue
-        
-        processed_filenames.add(pdf_filename)
 
         try:
-            year_dir.mkdir(parents=True, exist_ok=True)
-            destination_pdf_path = year_dir / pdf_filename
+            if year not in year_dir_contents:
+                # Year folders are created in one pass before moving, so a
+                # missing folder simply has no contents yet
+                try:
+                    with os.scandir(year_dir) as it:
+                        year_dir_contents[year] = {entry.name for entry in it}
+                except FileNotFoundError:
+                    year_dir_contents[year] = set()
 
-            if destination_pdf_path.exists():
-                # print(f"Info: Destination already exists, skipping: {destination_pdf_path}")
+            if pdf_filename in year_dir_contents[year]:
+                # print(f"Info: Destination already exists, skipping: {year_dir}/{pdf_filename}")
                 # If it already exists in the target, we can consider it "moved" or "organized"
                 # For accurate counting, we might not increment moved_files here if we want to count only actual moves by this run.
                 # However, if the goal is to ensure all files end up organized, this is fine.
@@ -155,15 +258,33 @@ def organize_pdfs():
                 skipped_files += 1
                 continue
 
-            shutil.move(str(source_pdf_path), str(destination_pdf_path))
-            # print(f"Moved: {source_pdf_path} -> {destination_pdf_path}")
-            moved_files += 1
+            pending_moves.append((year, pdf_filename))
+            existing_files.discard(pdf_filename)
+            year_dir_contents[year].add(pdf_filename)
         except OSError as e:
-            print(f"Error moving file {pdf_filename} to {year_dir}: {e}")
+            print(f"Error reading {year_dir} for {pdf_filename}: {e}")
             skipped_files += 1
         except Exception as e:
             print(f"An unexpected error occurred while processing {pdf_filename}: {e}")
             skipped_files += 1
+
+    if not loaded_items:
+        print("Error: No metadata loaded. Please check metadata files.")
+        return
+
+    # Create each destination year folder once, dropping moves into folders that cannot be created
+    for year in {year for year, _ in pending_moves}:
+        try:
+            os.makedirs(f"{docs_str}/{year}", exist_ok=True)
+        except OSError as e:
+            print(f"Error creating {docs_str}/{year}: {e}")
+            remaining = [move for move in pending_moves if move[0] != year]
+            skipped_files += len(pending_moves) - len(remaining)
+            pending_moves = remaining
+
+    moved, failed = _apply_moves(docs_str, pending_moves)
+    moved_files += moved
+    skipped_files += failed
             
     print(f"PDF organization complete. Moved {moved_files} files. Skipped or failed {skipped_files} files.")
 
@@ -3,11 +3,16 @@ Updated scraper script to handle shadow DOM elements on nationalbanken.dk
 '''
 import os
 import time
-import json
 import hashlib
+import functools
+import itertools
+import re
 import requests
 import subprocess
 import shlex
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from dlz_tools import DLZ
@@ -18,6 +23,19 @@ except ImportError:
     dlz = None
 
 
+# Set in the prebuilt runner image (see Dockerfile), which already ships
+# Chrome, ChromeDriver and the Python dependencies
+PREBUILT_IMAGE = bool(os.environ.get("DNSCRAPE_PREBUILT_IMAGE"))
+CHROMEDRIVER_PATH = os.environ.get("CHROMEDRIVER_PATH")
+# Debug screenshots around the cookie dialog are only taken when this is set
+DEBUG_SCREENSHOTS = bool(os.environ.get("DNSCRAPE_DEBUG_SCREENSHOTS"))
+# The full shadow DOM analysis printout on article pages is only produced when this is set
+DEBUG_SHADOW_DOM = bool(os.environ.get("DNSCRAPE_DEBUG_SHADOW"))
+# Where the DLZ bootstrap and the runner image install ChromeDriver. When it
+# exists it is used directly, saving webdriver-manager's release lookup
+DEFAULT_CHROMEDRIVER_PATH = "/usr/local/bin/chromedriver"
+
+
 def print_dlz(s: str):
     if ON_DLZ:
         dlz.send_user_script_info(s)
@@ -28,13 +46,12 @@ def print_dlz(s: str):
 if ON_DLZ:
     print_dlz("Running on DLZ")
 
-print_dlz("Updating Chrome...")
-if ON_DLZ:
-    script = """
+CHROME_INSTALL_SCRIPT = """
     #!/bin/bash
     set -e
 
-    # Install initial dependencies
+    # Install initial dependencies. The package lists are kept until the Chrome
+    # dependencies below are installed, so apt-get update only runs once
     apt-get update && \
         apt-get install -y \
         curl \
@@ -42,8 +59,7 @@ if ON_DLZ:
         unzip \
         wget \
         jq \
-        --no-install-recommends && \
-        rm -rf /var/lib/apt/lists/*
+        --no-install-recommends
 
     # Get the latest stable Chrome and ChromeDriver versions
     LATEST_STABLE_URL="https://googlechromelabs.github.io/chrome-for-testing/last-known-good-versions-with-downloads.json"
@@ -64,7 +80,6 @@ if ON_DLZ:
     ln -s /opt/chrome-linux64/chrome /usr/bin/google-chrome
 
     # Install dependencies for Chrome using the provided .deps file
-    apt-get update
     while read -r pkg; do
     apt-get satisfy -y --no-install-recommends "${pkg}";
     done < /opt/chrome-linux64/deb.deps
@@ -74,17 +89,27 @@ if ON_DLZ:
     unzip -o /tmp/chromedriver-linux64.zip -d /tmp/
     mv /tmp/chromedriver-linux64/chromedriver /usr/local/bin/
 
-    # Clean up temporary files
-    rm -rf /tmp/*
+    # Clean up temporary files and the package lists
+    rm -rf /tmp/* /var/lib/apt/lists/*
     """
 
+# Marks a machine where CHROME_INSTALL_SCRIPT has already succeeded
+BOOTSTRAP_SENTINEL = "/var/lib/dnscrape/bootstrapped"
+
+
+def _ensure_env():
+    """Installs Chrome and ChromeDriver on DLZ, once per machine."""
+    if not ON_DLZ or PREBUILT_IMAGE or os.path.exists(BOOTSTRAP_SENTINEL):
+        return
+
+    print_dlz("Updating Chrome...")
     # Run the script using subprocess
     try:
         # 'check=True' will raise a CalledProcessError if the script fails
         # 'shell=True' is needed to interpret the shell script syntax
         # 'executable' ensures the script is run with bash
         result = subprocess.run(
-            script, 
+            CHROME_INSTALL_SCRIPT, 
             shell=True, 
             check=True, 
             executable='/bin/bash',
@@ -97,13 +122,24 @@ if ON_DLZ:
         print(f"Script failed with exit code {e.returncode}")
         print("STDERR:", e.stderr)
         print("STDOUT:", e.stdout)
-        
-print_dlz("pip installing...")
+        return
 
-if ON_DLZ:
+    # Chrome is installed either way; without the sentinel the next run just installs it again
+    try:
+        os.makedirs(os.path.dirname(BOOTSTRAP_SENTINEL), exist_ok=True)
+        open(BOOTSTRAP_SENTINEL, "w").close()
+    except OSError as e:
+        print(f"Could not write {BOOTSTRAP_SENTINEL}: {e}")
+
+
+# The Python dependencies are needed by the imports below, so unlike the
+# Chrome install they cannot wait until main()
+if ON_DLZ and not PREBUILT_IMAGE:
+    print_dlz("pip installing...")
     dlz.pip_install("selenium>=4.0.0")
     dlz.pip_install("webdriver-manager>=4.0.0")
     dlz.pip_install("requests>=2.32.3")
+    dlz.pip_install("orjson>=3.9.0")
 
 
 
@@ -115,8 +151,382 @@ from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlsplit
 from selenium.common.exceptions import TimeoutException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+import orjson
+
+
+# Anything other than letters, digits, '.', '_' and '-' is replaced in saved filenames.
+# \w follows str.isalnum, so non-ASCII letters such as æøå are kept
+UNSAFE_FILENAME_CHARS = re.compile(r"[^\w.-]")
+
+# A URL pointing at a PDF, optionally followed by a query string or fragment.
+# ARTICLE_PDF_LINKS_SCRIPT applies the same test in JavaScript
+PDF_URL_PATTERN = re.compile(r"\.pdf(?:[?#]|$)", re.IGNORECASE)
+
+
+def article_url_key(url):
+    """Returns the key under which an article URL is deduplicated: the URL
+    without its fragment or a trailing slash on the path."""
+    parts = urlsplit(url)
+    return parts._replace(path=parts.path.rstrip('/'), fragment='').geturl()
+
+@functools.lru_cache(maxsize=4096)
+def resolve_pdf_url(base_url, href):
+    """Returns (full_url, filename) for a PDF href found on a page under base_url.
+    The same hrefs recur across articles, so results are cached."""
+    full_url = urljoin(base_url, href)
+    return full_url, os.path.basename(urlparse(full_url).path)
+
+@functools.lru_cache(maxsize=4096)
+def pdf_paths(docs_dir, filename):
+    """Returns (safe_filename, filepath, md5_filepath) for a PDF saved in docs_dir."""
+    safe_filename = UNSAFE_FILENAME_CHARS.sub('_', os.path.basename(filename))
+    filepath = os.path.join(docs_dir, safe_filename)
+    return safe_filename, filepath, filepath + ".md5"
+
+# Selectors are passed as script arguments rather than interpolated, so the
+# script text never changes and selectors cannot break out of the JS
+
+# Returns the element matching arguments[1] inside the shadow root of the
+# first element matching arguments[0]
+SHADOW_QUERY_SCRIPT = """
+    const host = document.querySelector(arguments[0]);
+    if (host && host.shadowRoot) {
+        return host.shadowRoot.querySelector(arguments[1]);
+    }
+    return null;
+"""
+
+# Shared by the walks below: returns the shadow roots hosted directly under root
+# (not those nested inside them), in document order. A TreeWalker visits the
+# elements in place instead of materializing a querySelectorAll('*') list
+SHADOW_ROOTS_IN_JS = """
+    function shadowRootsIn(root) {
+        const roots = [];
+        const walker = document.createTreeWalker(root, NodeFilter.SHOW_ELEMENT);
+        for (let el = walker.nextNode(); el; el = walker.nextNode()) {
+            if (el.shadowRoot) roots.push(el.shadowRoot);
+        }
+        return roots;
+    }
+"""
+
+# Returns all elements matching arguments[0] in any (nested) shadow root.
+# Iterative walk: each shadow root is visited exactly once, in document order
+SHADOW_QUERY_ALL_SCRIPT = SHADOW_ROOTS_IN_JS + """
+    const selector = arguments[0];
+    const elements = [];
+    const stack = [document];
+
+    while (stack.length) {
+        const root = stack.pop();
+
+        // Search the current shadow root
+        if (root !== document) {
+            try {
+                elements.push(...root.querySelectorAll(selector));
+            } catch (e) {
+                console.error('Error with selector in shadowRoot: ' + selector, e);
+            }
+        }
+
+        // Queue the shadow roots hosted directly under this root
+        const hosts = shadowRootsIn(root);
+        for (let i = hosts.length - 1; i >= 0; i--) {
+            stack.push(hosts[i]);
+        }
+    }
+
+    return elements;
+"""
+
+# Collects the PDF links on an article page in a single walk over the document
+# and all (nested) shadow roots. Returns {shadowLinks, documentLinks, customLinks}:
+#  - shadowLinks: {href, text, hasDownload} for anchors inside shadow roots that
+#    point at a PDF or carry a download attribute
+#  - documentLinks: {href, text, hasDownload} for light DOM anchors matching
+#    'a.related-card__link[download], a[href$=".pdf"]'
+#  - customLinks: {href, text, hostTag} for elements anywhere whose JSON 'link'
+#    attribute (e.g. dnb-related-card) has a PDF url
+ARTICLE_PDF_LINKS_SCRIPT = r"""
+    const pdfUrl = /\.pdf(?:[?#]|$)/i;
+    const shadowLinks = [];
+    const customLinks = [];
+    const documentLinks = [];
+    const stack = [document];
+    while (stack.length) {
+        const root = stack.pop();
+        const inShadow = root !== document;
+
+        // One TreeWalker pass per root classifies every element and collects
+        // the nested shadow roots, instead of a separate query for each kind
+        const hosts = [];
+        const walker = document.createTreeWalker(root, NodeFilter.SHOW_ELEMENT);
+        for (let el = walker.nextNode(); el; el = walker.nextNode()) {
+            if (el.tagName === 'A') {
+                if (inShadow) {
+                    const href = el.href || el.getAttribute('href') || '';
+                    if (pdfUrl.test(href) || el.hasAttribute('download')) {
+                        shadowLinks.push({
+                            href: href,
+                            text: el.textContent || null,
+                            hasDownload: el.hasAttribute('download')
+                        });
+                    }
+                } else if (el.matches('a.related-card__link[download], a[href$=".pdf"]')) {
+                    documentLinks.push({
+                        href: el.href || el.getAttribute('href') || '',
+                        text: el.textContent || null,
+                        hasDownload: el.hasAttribute('download')
+                    });
+                }
+            }
+
+            if (el.hasAttribute('link')) {
+                try {
+                    const linkObj = JSON.parse(el.getAttribute('link'));
+                    if (linkObj && linkObj.url && pdfUrl.test(linkObj.url)) {
+                        customLinks.push({
+                            href: linkObj.url,
+                            text: el.getAttribute('name') || el.getAttribute('header') || null,
+                            hostTag: el.tagName
+                        });
+                    }
+                } catch (e) {}
+            }
+
+            if (el.shadowRoot) hosts.push(el.shadowRoot);
+        }
+
+        // Queue nested shadow roots so they are visited in document order
+        for (let i = hosts.length - 1; i >= 0; i--) {
+            stack.push(hosts[i]);
+        }
+    }
+    return {shadowLinks: shadowLinks, documentLinks: documentLinks, customLinks: customLinks};
+"""
+
+# Returns an {name: value} dict of the attributes of each element in arguments[0]
+ELEMENT_ATTRIBUTES_SCRIPT = """
+    return arguments[0].map(el => {
+        const attrs = {};
+        for (const attr of el.attributes) {
+            attrs[attr.name] = attr.value;
+        }
+        return attrs;
+    });
+"""
+
+# Returns the attribute dicts of all elements matching arguments[0] in any (nested)
+# shadow root: SHADOW_QUERY_ALL_SCRIPT and ELEMENT_ATTRIBUTES_SCRIPT in one call
+SHADOW_QUERY_ALL_ATTRIBUTES_SCRIPT = """
+    const elements = (function () {""" + SHADOW_QUERY_ALL_SCRIPT + """}).apply(null, arguments);
+    return (function () {""" + ELEMENT_ATTRIBUTES_SCRIPT + """})(elements);
+"""
+
+# Returns true if any element in the document or a (nested) shadow root matches arguments[0]
+HAS_SHADOW_MATCH_SCRIPT = SHADOW_ROOTS_IN_JS + """
+    const roots = [document];
+    while (roots.length) {
+        const root = roots.pop();
+        if (root.querySelector(arguments[0])) return true;
+        roots.push(...shadowRootsIn(root));
+    }
+    return false;
+"""
+
+# Returns true once the page has a PDF link of a kind ARTICLE_PDF_LINKS_SCRIPT looks for:
+# a PDF or download anchor, or an element whose JSON 'link' attribute has a PDF url
+HAS_PDF_LINK_SCRIPT = SHADOW_ROOTS_IN_JS + r"""
+    const pdfUrl = /\.pdf(?:[?#]|$)/i;
+    const roots = [document];
+    while (roots.length) {
+        const root = roots.pop();
+        for (const a of root.querySelectorAll('a[href], a[download]')) {
+            if (pdfUrl.test(a.getAttribute('href') || '')) return true;
+            // Outside shadow roots only related-card downloads count, as in the collection script
+            if (a.hasAttribute('download') && (root !== document || a.matches('a.related-card__link'))) return true;
+        }
+        for (const el of root.querySelectorAll('[link]')) {
+            try {
+                const linkObj = JSON.parse(el.getAttribute('link'));
+                if (linkObj && linkObj.url && pdfUrl.test(linkObj.url)) return true;
+            } catch (e) {}
+        }
+        roots.push(...shadowRootsIn(root));
+    }
+    return false;
+"""
+
+# Returns the first visible, enabled element matching any of arguments[0],
+# searching the document and every (nested) shadow root
+FIND_COOKIE_BUTTON_SCRIPT = SHADOW_ROOTS_IN_JS + """
+    const selectors = arguments[0];
+    const roots = [document];
+    while (roots.length) {
+        const root = roots.pop();
+        for (const selector of selectors) {
+            const button = root.querySelector(selector);
+            if (button && button.offsetParent !== null && !button.disabled) {
+                return button;
+            }
+        }
+        roots.push(...shadowRootsIn(root));
+    }
+    return null;
+"""
+
+# Debugging aid for analyze_shadow_dom_structure: describes every shadow root on the
+# page and the PDF-looking links inside them
+SHADOW_STRUCTURE_SCRIPT = SHADOW_ROOTS_IN_JS + r"""
+    function describeHost(el) {
+        return (el.tagName || 'unknown').toLowerCase() +
+            (el.id ? '#' + el.id : '') +
+            (el.className && typeof el.className === 'string' ? '.' + el.className.replace(/\s+/g, '.') : '');
+    }
+
+    // Track all shadow DOM roots, and the PDF links found inside them
+    const shadowRoots = [];
+    const pdfLinks = [];
+
+    // Queues the shadow roots hosted directly under root so they pop in document order
+    const stack = [];
+    function queueShadowRoots(root, path) {
+        const roots = shadowRootsIn(root);
+        for (let i = roots.length - 1; i >= 0; i--) {
+            stack.push([roots[i], path + ' > ' + describeHost(roots[i].host)]);
+        }
+    }
+
+    // Visit every (nested) shadow root depth-first, using a worklist instead of recursion
+    queueShadowRoots(document, 'document');
+    while (stack.length) {
+        const [shadowRoot, nodePath] = stack.pop();
+        const el = shadowRoot.host;
+
+        // Gather info about this shadow root
+        const info = {
+            hostTagName: el.tagName,
+            hostId: el.id || null,
+            hostClass: el.className || null,
+            path: nodePath,
+            childElements: {}
+        };
+
+        // Look for interesting elements inside this shadow root
+        const links = shadowRoot.querySelectorAll('a');
+        if (links.length) {
+            info.links = Array.from(links).slice(0, 5).map(a => ({
+                href: a.href || null,
+                text: a.textContent || null,
+                download: a.hasAttribute('download'),
+                class: a.className || null
+            }));
+        }
+        for (const link of links) {
+            const href = link.href || link.getAttribute('href') || '';
+            if (href.toLowerCase().endsWith('.pdf') || link.hasAttribute('download')) {
+                pdfLinks.push({
+                    href: href,
+                    text: link.textContent || null,
+                    hasDownload: link.hasAttribute('download'),
+                    class: link.className || null,
+                    hostTag: el.tagName.toLowerCase(),
+                    hostPath: el.id ? '#' + el.id : el.className ? '.' + el.className.replace(/\s+/g, '.') : el.tagName.toLowerCase()
+                });
+            }
+        }
+
+        // Count element types in this shadow root
+        const walker = document.createTreeWalker(shadowRoot, NodeFilter.SHOW_ELEMENT);
+        for (let child = walker.nextNode(); child; child = walker.nextNode()) {
+            const tag = child.tagName.toLowerCase();
+            info.childElements[tag] = (info.childElements[tag] || 0) + 1;
+        }
+
+        shadowRoots.push(info);
+        queueShadowRoots(shadowRoot, nodePath);
+    }
+
+    return {
+        shadowRoots: shadowRoots,
+        pdfLinks: pdfLinks,
+        totalShadowRoots: shadowRoots.length
+    };
+"""
+
+# Fallback for extract_pdf_links_from_shadow_dom: returns {href, text, hasDownload,
+# class, hostPath} for the PDF links in the document and all (nested) shadow roots.
+# Stops once arguments[0] links are found, unless it is null
+SHADOW_PDF_LINKS_SCRIPT = SHADOW_ROOTS_IN_JS + r"""
+    const limit = arguments[0] == null ? Infinity : arguments[0];
+
+    // Track all PDF links
+    const pdfLinks = [];
+
+    // Common PDF link patterns, joined so each root is queried once. A selector list
+    // matches each element once, so links matching several patterns are not repeated
+    const PDF_SELECTOR = 'a[download], a[href*=".pdf" i], a.download-file, a.pdf-link';
+
+    // Search the document and all (nested) shadow roots depth-first, using a
+    // worklist of [root, path] pairs instead of recursion
+    const documentRoots = shadowRootsIn(document);
+    const stack = [[document, 'document']];
+    while (stack.length && pdfLinks.length < limit) {
+        const [node, path] = stack.pop();
+
+        // Check regular links in this node
+        for (const link of node.querySelectorAll(PDF_SELECTOR)) {
+            if (pdfLinks.length >= limit) break;
+            const href = link.href || link.getAttribute('href') || '';
+            if (href && (href.toLowerCase().includes('.pdf') || link.hasAttribute('download'))) {
+                pdfLinks.push({
+                    href: href,
+                    text: link.textContent?.trim() || null,
+                    hasDownload: link.hasAttribute('download'),
+                    class: link.className || null,
+                    hostPath: path
+                });
+            }
+        }
+
+        // Queue the shadow roots hosted directly under this node, in document order
+        const roots = node === document ? documentRoots : shadowRootsIn(node);
+        for (let i = roots.length - 1; i >= 0; i--) {
+            const el = roots[i].host;
+            const nodePath = path + ' > ' + (el.tagName || 'unknown').toLowerCase() +
+                (el.id ? '#' + el.id : '') +
+                (el.className && typeof el.className === 'string' ? '.' + el.className.replace(/\s+/g, '.') : '');
+            stack.push([roots[i], nodePath]);
+        }
+    }
+
+    // Look specifically for related card links which might be special components
+    for (const shadowRoot of documentRoots) {
+        for (const card of shadowRoot.querySelectorAll('*[class*="related-card"]')) {
+            // Try to find links inside related cards
+            for (const link of card.querySelectorAll('a')) {
+                if (pdfLinks.length >= limit) return pdfLinks;
+                const href = link.href || link.getAttribute('href') || '';
+                // Only PDF links are sent back over the wire
+                if (!href || !(href.toLowerCase().includes('.pdf') || link.hasAttribute('download'))) continue;
+                pdfLinks.push({
+                    href: href,
+                    text: link.textContent?.trim() || null,
+                    hasDownload: link.hasAttribute('download'),
+                    class: link.className || null,
+                    hostPath: 'related-card'
+                });
+            }
+        }
+    }
+
+    return pdfLinks;
+"""
 
 
 class NationalbankenScraper:
@@ -128,7 +538,27 @@ class NationalbankenScraper:
     START_URL = "https://www.nationalbanken.dk/da/soeg-i-vidensarkivet"
     DOCS_DIR = "docs"
     METADATA_FILE = "docs_metadata.csv"
+    PROCESSED_ARTICLES_FILE = "processed_articles.jsonl"
+    MD5_CACHE_FILE = "md5_cache.json"
+    NO_PDF_RECHECK_SECONDS = 7 * 24 * 3600  # Articles without PDFs are visited again after this long
     MAX_PAGES_TO_SCRAPE = 1
+    HTTP_POOL_SIZE = 20
+    DOWNLOAD_WORKERS = 8
+    ARTICLE_WORKERS = 4  # WebDrivers in total: one loads listing pages, the rest visit articles
+    MAX_PDF_BYTES = 200 * 1024 * 1024
+    ONLY_PRIMARY_PDF = False  # Download only the first PDF link of each article
+    COOKIE_BUTTON_SELECTORS = ["#CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll"]
+    # Requests the browser never makes: fonts, video and third-party trackers play no part
+    # in the DOM that is read. Images are blocked separately through the Chrome prefs
+    BLOCKED_URL_PATTERNS = [
+        "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4", "*.webm",
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*facebook.net*",
+    ]
+    USER_AGENT = (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+        'AppleWebKit/537.36 (KHTML, like Gecko) '
+        'Chrome/91.0.4472.124 Safari/537.36'
+    )
 
     def __init__(self, dlz_instance=None):
         """
@@ -138,10 +568,30 @@ class NationalbankenScraper:
             dlz_instance: An instance of the DLZ class for communication.
         """
         self.dlz = dlz_instance
+        self._local = threading.local()
         self.driver = None
+        # Drivers available to article workers, and the ones started in addition to the main driver
+        self.article_drivers = queue.Queue()
+        self.extra_drivers = []
         self.files_to_send = {}
+        self.session = self._create_http_session()
+        # PDFs download in the background while the driver moves on to the next article
+        self.download_pool = ThreadPoolExecutor(max_workers=self.DOWNLOAD_WORKERS)
+        self.download_futures = {}  # pdf_url -> (filename, Future), so a PDF is only fetched once
+        self._download_lock = threading.Lock()
         self.all_metadata = []
-        self.processed_article_urls = set()
+        self.processed_article_urls = set()  # article_url_key() of each visited article
+        # article_url_key() -> metadata rows, for articles fully processed by this or an earlier run
+        self.processed_articles = self._load_processed_articles()
+        # path -> [mtime_ns, size, md5], so unchanged files are not re-hashed on every run
+        self.md5_cache = self._load_md5_cache()
+        # saved filename -> the pdf_url downloaded to it, including PDFs recorded by earlier
+        # runs, so a different URL with the same basename never overwrites them
+        self.download_filenames = {
+            pdf_paths(self.DOCS_DIR, row['downloaded_filename'])[0]: row['pdf_url']
+            for rows in self.processed_articles.values() for row in rows
+            if row.get('downloaded_filename') and row.get('pdf_url')
+        }
 
     def __enter__(self):
         self.init_selenium_driver()
@@ -149,35 +599,117 @@ class NationalbankenScraper:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close_selenium_driver()
+        self.download_pool.shutdown(wait=True)
+        self.session.close()
         self._save_final_metadata()
+        self._save_md5_cache()
+
+    @property
+    def driver(self):
+        """The WebDriver for the calling thread: an article worker's checked-out
+        driver, otherwise the main driver."""
+        return getattr(self._local, 'driver', None) or self._main_driver
+
+    @driver.setter
+    def driver(self, value):
+        self._main_driver = value
+
+    @functools.cached_property
+    def chromedriver_path(self):
+        """Path of the ChromeDriver binary, or None to let Selenium locate it (DLZ).
+        Resolved once per scraper, since webdriver-manager checks online for the
+        latest version every time it is asked."""
+        # An already-installed driver is used as-is, skipping webdriver-manager
+        driver_path = CHROMEDRIVER_PATH or (
+            DEFAULT_CHROMEDRIVER_PATH if os.path.exists(DEFAULT_CHROMEDRIVER_PATH) else None
+        )
+        # webdriver-manager is for local debugging, not for DLZ
+        if not driver_path and not ON_DLZ:
+            driver_path = ChromeDriverManager().install()
+        return driver_path
+
+    def _create_driver(self):
+        """Starts a new headless Chrome WebDriver, or returns None on failure."""
+        try:
+            chrome_options = ChromeOptions()
+            chrome_options.add_argument("--headless")
+            chrome_options.add_argument("--no-sandbox")
+            chrome_options.add_argument("--disable-dev-shm-usage")
+            chrome_options.add_argument("--window-size=1920,1080")
+            chrome_options.add_argument("--disable-gpu")
+            chrome_options.add_argument("--disable-extensions")
+            # Only the DOM is read, so images are never fetched, and get() returns at
+            # DOMContentLoaded. Nothing waits for the load event after that; the element
+            # waits (search results, article heading and links) cover what renders later
+            chrome_options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
+            chrome_options.page_load_strategy = "eager"
+            
+            if self.chromedriver_path:
+                service = ChromeService(self.chromedriver_path)
+                driver = webdriver.Chrome(service=service, options=chrome_options)
+            
+            # Use this for DLZ environment
+            else:
+                driver = webdriver.Chrome(options=chrome_options)
+        except Exception as e:
+            print_dlz(f"Error initializing WebDriver: {e}")
+            return None
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            # Blocking is only an optimization; the driver works without it
+            print(f"Could not block URLs in WebDriver: {e}")
+        return driver
 
     def init_selenium_driver(self):
-        """Initializes the Selenium WebDriver."""
+        """Initializes the Selenium WebDriver, plus the extra drivers used to visit articles in parallel."""
         if self.driver is None:
             print("Initializing Selenium WebDriver...")
-            try:
-                chrome_options = ChromeOptions()
-                chrome_options.add_argument("--headless")
-                chrome_options.add_argument("--no-sandbox")
-                chrome_options.add_argument("--disable-dev-shm-usage")
-                chrome_options.add_argument("--window-size=1920,1080")
-                
-                # The following two lines are for local debugging, not for DLZ
-                if not ON_DLZ:
-                    service = ChromeService(ChromeDriverManager().install())
-                    self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                
-                # Use this for DLZ environment
-                else:
-                    self.driver = webdriver.Chrome(options=chrome_options)
-                print_dlz("WebDriver initialized successfully.")
-            except Exception as e:
-                print_dlz(f"Error initializing WebDriver: {e}")
-                self.driver = None
+            self.driver = self._create_driver()
+            if self.driver is None:
+                return None
+            print_dlz("WebDriver initialized successfully.")
+
+            # The main driver loads the next listing page while the extra drivers visit
+            # articles; it only joins the article pool if no extra driver could be started
+            for _ in range(self.ARTICLE_WORKERS - 1):
+                extra_driver = self._create_driver()
+                if extra_driver is None:
+                    break
+                self.extra_drivers.append(extra_driver)
+                self.article_drivers.put(extra_driver)
+            if not self.extra_drivers:
+                self.article_drivers.put(self.driver)
+            print_dlz(f"Visiting articles with {self.article_drivers.qsize()} WebDriver(s).")
         return self.driver
 
+    def _create_http_session(self):
+        """Creates a keep-alive HTTP session so PDF downloads reuse connections."""
+        session = requests.Session()
+        session.headers.update({
+            'User-Agent': self.USER_AGENT,
+            # Only advertises encodings urllib3 can decode (br needs brotli installed)
+            'Accept-Encoding': ACCEPT_ENCODING,
+        })
+        adapter = HTTPAdapter(
+            pool_connections=self.HTTP_POOL_SIZE,
+            pool_maxsize=self.HTTP_POOL_SIZE,
+            # Transient server errors are retried too, not just connection failures
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504)),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
     def close_selenium_driver(self):
-        """Closes the Selenium WebDriver."""
+        """Closes the Selenium WebDriver and the extra article drivers."""
+        for extra_driver in self.extra_drivers:
+            extra_driver.quit()
+        self.extra_drivers = []
+        self.article_drivers = queue.Queue()
         if self.driver:
             self.driver.quit()
             self.driver = None
@@ -186,14 +718,9 @@ class NationalbankenScraper:
     def find_in_shadow_root(self, host_css_selector, shadow_css_selector):
         '''Find element within a shadow root using JavaScript execution.'''
         try:
-            script = f"""
-                const host = document.querySelector('{host_css_selector}');
-                if (host && host.shadowRoot) {{
-                    return host.shadowRoot.querySelector('{shadow_css_selector}');
-                }}
-                return null;
-            """
-            return self.driver.execute_script(script)
+            return self.driver.execute_script(
+                SHADOW_QUERY_SCRIPT, host_css_selector, shadow_css_selector
+            )
         except Exception as e:
             print(f"Error finding element in shadow root: {e}")
             return None
@@ -204,39 +731,9 @@ class NationalbankenScraper:
             # Set a script timeout to prevent freezing
             self.driver.set_script_timeout(30)  # 30 seconds
 
-            script = f'''
-                const elements = [];
-                const visited = new Set();
-
-                function findInChildren(node) {{
-                    if (!node || visited.has(node)) return;
-                    visited.add(node);
-
-                    // Search in the current node's shadow root
-                    if (node.shadowRoot) {{
-                        try {{
-                            const found = node.shadowRoot.querySelectorAll(`{shadow_css_selector}`);
-                            elements.push(...found);
-                        }} catch (e) {{
-                            console.error(`Error with selector in shadowRoot: {shadow_css_selector}`, e);
-                        }}
-                        // Important: also search inside the shadow root for more shadow hosts
-                        findInChildren(node.shadowRoot);
-                    }}
-
-                    // Search for shadow hosts in the children of the current node (or shadow root)
-                    const children = node.querySelectorAll('*');
-                    for (const child of children) {{
-                        if (child.shadowRoot) {{
-                            findInChildren(child);
-                        }}
-                    }}
-                }}
-
-                findInChildren(document);
-                return elements;
-            '''
-            elements = self.driver.execute_script(script)
+            elements = self.driver.execute_script(
+                SHADOW_QUERY_ALL_SCRIPT, shadow_css_selector
+            )
             print(f"Found {len(elements)} elements in all shadow roots with selector: {shadow_css_selector}")
             return elements
         except TimeoutException:
@@ -246,22 +743,65 @@ class NationalbankenScraper:
             print(f"Error finding elements in shadow roots: {e}")
             return []
 
+    def find_attributes_in_all_shadow_roots(self, shadow_css_selector):
+        '''Returns the attribute dictionaries of all elements matching shadow_css_selector
+        in any shadow root, in a single round-trip.'''
+        try:
+            self.driver.set_script_timeout(30)
+            attributes = self.driver.execute_script(
+                SHADOW_QUERY_ALL_ATTRIBUTES_SCRIPT, shadow_css_selector
+            )
+            print(f"Found {len(attributes)} elements in all shadow roots with selector: {shadow_css_selector}")
+            return attributes
+        except TimeoutException:
+            print(f"Timeout while searching for elements with selector: {shadow_css_selector}")
+            return []
+        except Exception as e:
+            print(f"Error finding elements in shadow roots: {e}")
+            return []
+
+    def wait_for_shadow_element(self, css_selector, timeout=10):
+        '''Waits until an element matching css_selector exists in the document or any
+        shadow root. Returns False if none appeared within the timeout.'''
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                lambda driver: driver.execute_script(HAS_SHADOW_MATCH_SCRIPT, css_selector)
+            )
+            return True
+        except TimeoutException:
+            print(f"No element matching {css_selector} appeared within {timeout}s.")
+            return False
+
+    def wait_for_pdf_links(self, timeout=10):
+        '''Waits until the page has a PDF link in the document or any shadow root,
+        including custom elements whose JSON link attribute points at a PDF.
+        Returns False if none appeared within the timeout.'''
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                lambda driver: driver.execute_script(HAS_PDF_LINK_SCRIPT)
+            )
+            return True
+        except TimeoutException:
+            print(f"No PDF link appeared within {timeout}s.")
+            return False
+
     def accept_cookies(self):
         '''Accepts cookies by clicking the "Allow all cookies" button if it's present.
         Handles both normal DOM and shadow DOM elements.'''
         try:
             print("Looking for cookie consent dialog...")
             
-            # First check regular DOM
+            # Check the regular DOM and all shadow roots in a single script per poll
             try:
-                # Wait for regular cookie dialog (shorter timeout)
+                # Wait for the cookie dialog (shorter timeout)
                 cookie_button = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.ID, "CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll"))
+                    lambda driver: driver.execute_script(FIND_COOKIE_BUTTON_SCRIPT, self.COOKIE_BUTTON_SELECTORS)
                 )
-                print("Cookie dialog found in regular DOM. Accepting cookies...")
+                print("Cookie dialog found. Accepting cookies...")
                 
                 # Take screenshot before clicking
-                self.driver.get_screenshot_as_file("before_cookie_click.png")
+                if DEBUG_SCREENSHOTS:
+                    self.driver.get_screenshot_as_file("before_cookie_click.png")
                 
                 # Try JavaScript click for reliability
                 self.driver.execute_script("arguments[0].click();", cookie_button)
@@ -278,14 +818,17 @@ class NationalbankenScraper:
                 print(f"Cookie dialog not found in regular DOM: {dom_error}")
                 #print("Checking for cookie dialog in shadow DOM...")
             
-            # Wait for the page to stabilize before taking the screenshot
-            time.sleep(1) 
+            # Wait for the whole dialog to go away before the screenshot
+            try:
+                WebDriverWait(self.driver, 5).until(
+                    EC.invisibility_of_element_located((By.ID, "CybotCookiebotDialog"))
+                )
+            except TimeoutException:
+                print("Cookie dialog still visible after 5s.")
 
             # Take a screenshot after clicking
-            self.driver.get_screenshot_as_file("after_cookie_click.png")
-            
-            # Wait for dialog to disappear and page to stabilize
-            time.sleep(2)
+            if DEBUG_SCREENSHOTS:
+                self.driver.get_screenshot_as_file("after_cookie_click.png")
             return True
         
         except Exception as e:
@@ -293,45 +836,64 @@ class NationalbankenScraper:
             print("Continuing without accepting cookies.")
             return False
 
-    def extract_attributes_from_shadow_element(self, element):
-        '''Extract all attributes from a shadow DOM element'''
+    def extract_attributes_from_shadow_elements(self, elements):
+        '''Extract all attributes from a list of shadow DOM elements in a single round-trip.
+        Returns one attribute dictionary per element, in order.'''
         try:
-            attrs = self.driver.execute_script("""
-                const attrs = {};
-                for (const attr of arguments[0].attributes) {
-                    attrs[attr.name] = attr.value;
-                }
-                return attrs;
-            """, element)
-            return attrs
+            return self.driver.execute_script(ELEMENT_ATTRIBUTES_SCRIPT, elements)
         except Exception as e:
             print(f"Error extracting attributes: {e}")
-            return {}
+            return [{} for _ in elements]
         
     def compute_md5(self, path):
-        hash_md5 = hashlib.md5()
         try:
+            # Reuse the hash of a file whose modification time and size are unchanged
+            st = os.stat(path)
+            cached = self.md5_cache.get(path)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached[2]
+            # file_digest runs the read/hash loop in C and releases the GIL
             with open(path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+                md5_hash = hashlib.file_digest(f, "md5").hexdigest()
+            self._cache_md5(path, md5_hash, st)
+            return md5_hash
         except Exception as e:
             print(f"Error computing MD5 for {path}: {e}")
             return None
 
-    def download_pdf(self, pdf_url, filename):
-        '''Downloads a PDF from a URL to a local file, saves an MD5 file, and skips download if file with matching MD5 exists.'''
-        if not os.path.exists(self.DOCS_DIR):
-            os.makedirs(self.DOCS_DIR)
+    def _cache_md5(self, path, md5_hash, st=None):
+        """Records md5_hash for path as of its current (or the given) os.stat result."""
+        st = st or os.stat(path)
+        self.md5_cache[path] = [st.st_mtime_ns, st.st_size, md5_hash]
 
-        safe_filename = "".join(
-            c if c.isalnum() or c in ('.', '_', '-') else '_' 
-            for c in os.path.basename(filename)
-        )
-        filepath = os.path.join(self.DOCS_DIR, safe_filename)
-        md5_filepath = filepath + ".md5"
+    def _load_md5_cache(self):
+        """Loads the MD5 cache saved by an earlier run, or returns an empty dict."""
+        try:
+            with open(self.MD5_CACHE_FILE, "rb") as f:
+                cache = orjson.loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"Could not load {self.MD5_CACHE_FILE}, re-hashing existing files: {e}")
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def _save_md5_cache(self):
+        """Saves the MD5 cache for the next run."""
+        try:
+            with open(self.MD5_CACHE_FILE, "wb") as f:
+                f.write(orjson.dumps(self.md5_cache))
+        except OSError as e:
+            print(f"Error saving {self.MD5_CACHE_FILE}: {e}")
 
-        # If file exists, check MD5
+    def download_pdf(self, pdf_url, filename):
+        '''Downloads a PDF from a URL to a local file, saves an MD5 file, and skips download if file with matching MD5 exists.
+        Expects DOCS_DIR to exist; run() creates it.'''
+        safe_filename, filepath, md5_filepath = pdf_paths(self.DOCS_DIR, filename)
+        partial_filepath = filepath + ".part"
+
+        # If file exists, check MD5. compute_md5 answers from the cache when the file is
+        # unchanged on disk, so this costs no network round trip and usually no read
         if os.path.exists(filepath) and os.path.exists(md5_filepath):
             existing_md5 = self.compute_md5(filepath)
             try:
@@ -354,27 +916,48 @@ class NationalbankenScraper:
                 )
 
         try:
-            headers = {
-                'User-Agent': (
-                    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-                    'AppleWebKit/537.36 (KHTML, like Gecko) '
-                    'Chrome/91.0.4472.124 Safari/537.36'
-                )
-            }
-            response = requests.get(
-                pdf_url, stream=True, timeout=30, headers=headers
-            )
-            response.raise_for_status()
-            with open(filepath, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            with self.session.get(pdf_url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                # Don't save HTML error pages served with a 200 status
+                content_type = response.headers.get('Content-Type', '').lower()
+                if content_type.startswith('text/'):
+                    print(f"Error downloading {pdf_url}: expected a PDF but got {content_type}")
+                    return None
+                # Check the PDF header before touching the file, so an error page served
+                # as application/octet-stream cannot replace a good copy. Readers accept
+                # the header anywhere in the first 1024 bytes
+                chunks = response.iter_content(chunk_size=65536)
+                head = b""
+                for chunk in chunks:
+                    head += chunk
+                    if len(head) >= 1024:
+                        break
+                if b"%PDF-" not in head[:1024]:
+                    print(f"Error downloading {pdf_url}: response is not a PDF")
+                    return None
+                # Hash while writing rather than re-reading the file afterwards. The PDF is
+                # written beside its final name and moved into place once complete, so an
+                # interrupted download never leaves a truncated file or replaces a good copy
+                hash_md5 = hashlib.md5()
+                total_bytes = 0
+                with open(partial_filepath, "wb") as f:
+                    for chunk in itertools.chain((head,), chunks):
+                        total_bytes += len(chunk)
+                        if total_bytes > self.MAX_PDF_BYTES:
+                            break
+                        f.write(chunk)
+                        hash_md5.update(chunk)
+                if total_bytes > self.MAX_PDF_BYTES:
+                    print(f"Error downloading {pdf_url}: exceeds {self.MAX_PDF_BYTES} bytes")
+                    return None
+                os.replace(partial_filepath, filepath)
+                md5_hash = hash_md5.hexdigest()
+                self._cache_md5(filepath, md5_hash)
             #print_dlz(f"Downloaded {safe_filename}")
-            # Compute and save MD5
-            md5_hash = self.compute_md5(filepath)
-            if md5_hash:
-                with open(md5_filepath, "w", encoding="utf-8") as f:
-                    f.write(md5_hash)
-                print(f"MD5 hash saved to {md5_filepath}")
+            # Save MD5
+            with open(md5_filepath, "w", encoding="utf-8") as f:
+                f.write(md5_hash)
+            print(f"MD5 hash saved to {md5_filepath}")
             self.files_to_send[filepath] = md5_hash
             return md5_hash
         except requests.exceptions.RequestException as e:
@@ -383,105 +966,52 @@ class NationalbankenScraper:
         except IOError as e:
             print(f"Error writing file {filepath}: {e}")
             return None
+        finally:
+            # Drop the partial file of a rejected or interrupted download
+            try:
+                os.remove(partial_filepath)
+            except FileNotFoundError:
+                pass
+
+    def submit_download(self, pdf_url, filename):
+        '''Schedules download_pdf on the download pool and returns (filename, Future).
+        A URL that is already scheduled reuses the earlier Future. If another URL
+        already uses filename, a short hash of pdf_url is appended to it, so the
+        name is the same on every run and each URL keeps its own file.'''
+        with self._download_lock:
+            scheduled = self.download_futures.get(pdf_url)
+            if scheduled is not None:
+                return scheduled
+            safe_filename = pdf_paths(self.DOCS_DIR, filename)[0]
+            claimed_by = self.download_filenames.get(safe_filename)
+            if claimed_by is not None and claimed_by != pdf_url:
+                stem, ext = os.path.splitext(filename)
+                filename = f"{stem}_{hashlib.md5(pdf_url.encode('utf-8')).hexdigest()[:8]}{ext}"
+                print(f"{safe_filename} is already used by {claimed_by}; saving {pdf_url} as {filename}")
+                safe_filename = pdf_paths(self.DOCS_DIR, filename)[0]
+            self.download_filenames[safe_filename] = pdf_url
+            scheduled = (filename, self.download_pool.submit(self.download_pdf, pdf_url, filename))
+            self.download_futures[pdf_url] = scheduled
+        return scheduled
+
+    def extract_article_pdf_links(self):
+        '''Returns (shadow_links, document_links, custom_links) for the current article
+        page, collected in a single script call. shadow_links has the same shape as the
+        'pdfLinks' entry of analyze_shadow_dom_structure; custom_links matches
+        extract_pdf_links_from_custom_elements.'''
+        try:
+            links = self.driver.execute_script(ARTICLE_PDF_LINKS_SCRIPT)
+            return links['shadowLinks'], links['documentLinks'], links['customLinks']
+        except Exception as e:
+            print(f"Error extracting PDF links: {e}")
+            return [], [], []
 
     def analyze_shadow_dom_structure(self):
         '''Analyze the shadow DOM structure of the current page and print useful information'''
         print("\nAnalyzing shadow DOM structure of current page...")
         
         # Execute JavaScript to recursively inspect all shadow roots and return useful information
-        structure = self.driver.execute_script(r"""
-        // Track all shadow DOM roots
-        const shadowRoots = [];
-        
-        // Find all shadow roots in the document
-        function findShadowRoots(node, path) {
-            if (!node) return;
-            
-            if (node.querySelectorAll) {
-                const elements = node.querySelectorAll('*');
-                for (const el of elements) {
-                    if (el.shadowRoot) {
-                        const nodePath = path + ' > ' + (el.tagName || 'unknown').toLowerCase() + 
-                            (el.id ? '#' + el.id : '') + 
-                            (el.className && typeof el.className === 'string' ? '.' + el.className.replace(/\s+/g, '.') : '');
-                        
-                        // Gather info about this shadow root
-                        const info = {
-                            hostTagName: el.tagName,
-                            hostId: el.id || null,
-                            hostClass: el.className || null,
-                            path: nodePath,
-                            childElements: {}
-                        };
-                        
-                        // Look for interesting elements inside this shadow root
-                        const links = el.shadowRoot.querySelectorAll('a');
-                        if (links.length) {
-                            info.links = Array.from(links).slice(0, 5).map(a => ({
-                                href: a.href || null,
-                                text: a.textContent || null,
-                                download: a.hasAttribute('download'),
-                                class: a.className || null
-                            }));
-                        }
-                        
-                        // Count element types in this shadow root
-                        Array.from(el.shadowRoot.querySelectorAll('*')).forEach(child => {
-                            const tag = child.tagName.toLowerCase();
-                            info.childElements[tag] = (info.childElements[tag] || 0) + 1;
-                        });
-                        
-                        shadowRoots.push(info);
-                        
-                        // Recursively check for nested shadow roots
-                        findShadowRoots(el.shadowRoot, nodePath);
-                    }
-                }
-            }
-        }
-        
-        findShadowRoots(document, 'document');
-        
-        // Also specifically look for PDF links in all shadow roots
-        const pdfLinks = [];
-        
-        function findPdfLinksInShadows(rootNode) {
-            if (!rootNode || !rootNode.querySelectorAll) return;
-            
-            // Check all elements for shadow roots
-            const elements = rootNode.querySelectorAll('*');
-            for (const el of elements) {
-                if (el.shadowRoot) {
-                    // Look for links in this shadow root
-                    const links = el.shadowRoot.querySelectorAll('a');
-                    for (const link of links) {
-                        const href = link.href || link.getAttribute('href') || '';
-                        if (href.toLowerCase().endsWith('.pdf') || link.hasAttribute('download')) {
-                            pdfLinks.push({
-                                href: href,
-                                text: link.textContent || null,
-                                hasDownload: link.hasAttribute('download'),
-                                class: link.className || null,
-                                hostTag: el.tagName.toLowerCase(),
-                                hostPath: el.id ? '#' + el.id : el.className ? '.' + el.className.replace(/\s+/g, '.') : el.tagName.toLowerCase()
-                            });
-                        }
-                    }
-                    
-                    // Recursively check nested shadow roots
-                    findPdfLinksInShadows(el.shadowRoot);
-                }
-            }
-        }
-        
-        findPdfLinksInShadows(document);
-        
-        return {
-            shadowRoots: shadowRoots,
-            pdfLinks: pdfLinks,
-            totalShadowRoots: shadowRoots.length
-        };
-    """)
+        structure = self.driver.execute_script(SHADOW_STRUCTURE_SCRIPT)
         
         print(f"\nFound {structure.get('totalShadowRoots', 0)} shadow roots on page")
         
@@ -507,155 +1037,34 @@ class NationalbankenScraper:
                 
         return structure
 
-    def extract_pdf_links_from_shadow_dom(self):
+    def extract_pdf_links_from_shadow_dom(self, limit=None):
         '''Extract all PDF links from shadow DOM using specialized JavaScript.
-        Returns a list of dictionaries with href and other properties.'''
+        Returns a list of dictionaries with href and other properties.
+        With a limit, the walk stops once that many links are found.'''
         print("Extracting PDF links from shadow DOM with specialized JavaScript...")
         
-        script = r"""
-        // Track all PDF links
-        const pdfLinks = [];
-        
-        // Common PDF link patterns
-        const PDF_SELECTORS = [
-            'a.related-card__link[download]',
-            'a.related-card__link[href$=".pdf"]',
-            'a[download]',
-            'a[href$=".pdf"]',
-            'a[href*=".pdf"]',
-            'a.download-file',
-            'a.pdf-link'
-        ];
-        
-        // Search document and all shadow roots recursively
-        function findPdfLinks(node, path) {
-            if (!node || !node.querySelectorAll) return;
-            
-            // Check regular links in this node
-            PDF_SELECTORS.forEach(selector => {
-                try {
-                    const links = node.querySelectorAll(selector);
-                    for (const link of links) {
-                        const href = link.href || link.getAttribute('href') || '';
-                        if (href.toLowerCase().includes('.pdf') || link.hasAttribute('download')) {
-                            pdfLinks.push({
-                                href: href,
-                                text: link.textContent?.trim() || null,
-                                hasDownload: link.hasAttribute('download'),
-                                class: link.className || null,
-                                hostPath: path
-                            });
-                        }
-                    }
-                } catch (e) {
-                    console.error('Error searching for selector:', selector, e);
-                }
-            });
-            
-            // Check for shadow roots
-            if (node.querySelectorAll) {
-                const elements = node.querySelectorAll('*');
-                for (const el of elements) {
-                    if (el.shadowRoot) {
-                        const nodePath = path + ' > ' + (el.tagName || 'unknown').toLowerCase() + 
-                            (el.id ? '#' + el.id : '') + 
-                            (el.className && typeof el.className === 'string' ? '.' + el.className.replace(/\s+/g, '.') : '');
-                        
-                        // Search inside this shadow root
-                        findPdfLinks(el.shadowRoot, nodePath);
-                    }
-                }
-            }
-        }
-        
-        // Start searching from the document
-        findPdfLinks(document, 'document');
-        
-        // Look specifically for related card links which might be special components
-        document.querySelectorAll('*').forEach(el => {
-            if (el.shadowRoot) {
-                const relatedCards = el.shadowRoot.querySelectorAll('*[class*="related-card"]');
-                if (relatedCards.length) {
-                    relatedCards.forEach(card => {
-                        // Try to find links inside related cards
-                        const links = card.querySelectorAll('a');
-                        links.forEach(link => {
-                            const href = link.href || link.getAttribute('href') || '';
-                            pdfLinks.push({
-                                href: href,
-                                text: link.textContent?.trim() || null,
-                                hasDownload: link.hasAttribute('download'),
-                                class: link.className || null,
-                                hostPath: 'related-card'
-                            });
-                        });
-                    });
-                }
-            }
-        });
-        
-        return pdfLinks;
-    """
-        
-        links = self.driver.execute_script(script)
-        print(f"Found {len(links)} potential PDF links in shadow DOM.")
-        
-        # Filter to keep only actual PDF links
-        pdf_links = [link for link in links if link['href'] and 
-                    ('.pdf' in link['href'].lower() or link.get('hasDownload'))]
-        
-        print(f"After filtering: {len(pdf_links)} PDF links.")
+        # The script only returns actual PDF links, so no filtering is needed here
+        pdf_links = self.driver.execute_script(SHADOW_PDF_LINKS_SCRIPT, limit)
+        print(f"Found {len(pdf_links)} PDF links in shadow DOM.")
         return pdf_links
 
     def extract_pdf_links_from_custom_elements(self):
-        script = '''
-            // Find all elements with a 'link' attribute (e.g., dnb-related-card)
-            let results = [];
-            function extractFromNode(node) {
-                if (!node || !node.querySelectorAll) return;
-                const all = node.querySelectorAll('[link]');
-                for (const el of all) {
-                    let linkAttr = el.getAttribute('link');
-                    if (linkAttr) {
-                        try {
-                            let linkObj = JSON.parse(linkAttr);
-                            if (linkObj && linkObj.url && linkObj.url.toLowerCase().endsWith('.pdf')) {
-                                results.push({
-                                    href: linkObj.url,
-                                    text: el.getAttribute('name') || el.getAttribute('header') || null,
-                                    hostTag: el.tagName
-                                });
-                            }
-                        } catch (e) {}
-                    }
-                }
-                // Search shadow roots recursively
-                const elements = node.querySelectorAll('*');
-                for (const el of elements) {
-                    if (el.shadowRoot) {
-                        extractFromNode(el.shadowRoot);
-                    }
-                }
-            }
-            extractFromNode(document);
-            return results;
-        '''
-        return self.driver.execute_script(script)
+        '''Find PDF links in the JSON 'link' attribute of custom elements (e.g. dnb-related-card).'''
+        return self.extract_article_pdf_links()[2]
 
     def save_metadata_per_page(self, metadata, page_num):
         '''Saves the current metadata to a JSON file with page number in the filename'''
         if not metadata:
             print(f"No metadata to save for page {page_num}")
             return
-            
-        if not os.path.exists(self.DOCS_DIR):
-            os.makedirs(self.DOCS_DIR)
-            
+
         metadata_filename = os.path.join(self.DOCS_DIR, f"metadata_page_{page_num}.json")
         
         try:
-            with open(metadata_filename, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=4, ensure_ascii=False)
+            # orjson writes compact UTF-8 bytes directly; organize_pdfs.py splices the
+            # arrays as they are, so the pages need no indentation
+            with open(metadata_filename, "wb") as f:
+                f.write(orjson.dumps(metadata))
             print_dlz(f"Metadata for page {page_num} saved to {metadata_filename}")
             #self.sent_files.add(metadata_filename)
         except Exception as e:
@@ -682,8 +1091,7 @@ class NationalbankenScraper:
             with open(csv_file, "w", encoding="utf-8", newline='') as f:
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
-                for row in self.all_metadata:
-                    writer.writerow(row)
+                writer.writerows(self.all_metadata)
 
             md5_hash = self.compute_md5(csv_file)
             
@@ -696,6 +1104,190 @@ class NationalbankenScraper:
         else:
             print_dlz("No PDFs were downloaded, so no metadata file created.")
 
+    def _load_processed_articles(self):
+        """Loads the articles recorded by earlier runs, or returns an empty dict.
+        Later lines win, and a line cut short by an interrupted run is skipped.
+        Articles that had no PDF are dropped once NO_PDF_RECHECK_SECONDS have
+        passed, so they are checked again for newly added PDFs."""
+        processed = {}
+        recheck_before = time.time() - self.NO_PDF_RECHECK_SECONDS
+        try:
+            with open(self.PROCESSED_ARTICLES_FILE, "rb") as f:
+                for line in f:
+                    try:
+                        record = orjson.loads(line)
+                        if record['rows'] or record.get('checked', 0) >= recheck_before:
+                            processed[record['key']] = record['rows']
+                        else:
+                            processed.pop(record['key'], None)
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Could not load {self.PROCESSED_ARTICLES_FILE}, revisiting all articles: {e}")
+            return {}
+        return processed
+
+    def _append_processed_articles(self, articles):
+        """Appends {article_url_key: metadata rows} to the processed-articles journal,
+        one JSON line per article, so progress survives an interrupted run."""
+        if not articles:
+            return
+        checked = time.time()
+        try:
+            with open(self.PROCESSED_ARTICLES_FILE, "ab") as f:
+                f.write(b"".join(
+                    orjson.dumps({'key': key, 'rows': rows, 'checked': checked}, option=orjson.OPT_APPEND_NEWLINE)
+                    for key, rows in articles.items()
+                ))
+        except OSError as e:
+            print(f"Error saving {self.PROCESSED_ARTICLES_FILE}: {e}")
+
+    def process_article(self, article):
+        '''Visits an article page with the calling thread's driver and schedules downloads
+        for its PDF links. Returns a list of (article, pdf_url, filename, future).'''
+        downloads = []
+        article_url = article['url']
+        article_title = article['title']
+        
+        print(f"  Visiting article page: {article_title} ({article_url})")
+        # Load the article page
+        self.driver.get(article_url)
+
+        # A slow heading is no reason to give up on the article; the waits below still
+        # give its links time to render. Presence is enough, clickability costs extra checks
+        try:
+            WebDriverWait(self.driver, 5).until(
+                EC.presence_of_element_located((By.CLASS_NAME, "h2"))
+            )
+        except TimeoutException:
+            print(f"  Timed out waiting for the heading of {article_url}")
+        # Wait for the links to render instead of for the load event, which get() no longer
+        # waits for. It gets the five seconds the removed load wait had
+        self.wait_for_pdf_links(timeout=5)
+        
+        # One script call collects the shadow DOM anchors, the light DOM anchors
+        # and the custom-element PDF links
+        pdf_links_from_analysis, document_pdf_links, custom_pdf_links = self.extract_article_pdf_links()
+
+        # The full structure analysis is diagnostic output only
+        if DEBUG_SHADOW_DOM:
+            self.analyze_shadow_dom_structure()
+        
+        # First try to use the PDF links we found in the shadow DOM. The script returns
+        # plain {href, text, hasDownload} dicts, which are used as they are
+        pdf_links = [
+            link_info for link_info in pdf_links_from_analysis
+            if link_info.get('href') and (PDF_URL_PATTERN.search(link_info['href']) or link_info.get('hasDownload'))
+        ]
+        
+        # If no PDF links found through analysis, use the regular DOM matches. A further
+        # per-selector search of the shadow roots cannot find anything the analysis missed
+        if not pdf_links:
+            pdf_links = document_pdf_links
+        
+        all_pdf_links = list(pdf_links)
+        seen_hrefs = {l.get('href') for l in all_pdf_links}
+        for link in custom_pdf_links:
+            href = link.get('href')
+            if href and href not in seen_hrefs:
+                all_pdf_links.append(link)
+                seen_hrefs.add(href)
+
+        #print_dlz(f"Found {len(all_pdf_links)} total potential PDF links")
+
+        # Relative and absolute hrefs, or several anchors for one file, can resolve to the same PDF
+        seen_pdf_urls = set()
+        for pdf_link in all_pdf_links:
+            try:
+                # Every candidate is a plain dict snapshot, so no further browser round trips are needed
+                pdf_href = pdf_link.get('href')
+                if pdf_href:
+                    print(f"Processing PDF link: {pdf_href}")
+                if pdf_href and PDF_URL_PATTERN.search(pdf_href):
+                    full_pdf_url, pdf_filename = resolve_pdf_url(self.BASE_URL, pdf_href)
+                    if full_pdf_url in seen_pdf_urls:
+                        continue
+                    seen_pdf_urls.add(full_pdf_url)
+                    if not pdf_filename:
+                        print(f"Could not determine filename for PDF: {full_pdf_url}")
+                        continue
+                    print(f"Found PDF: {full_pdf_url}")
+                    pdf_filename, future = self.submit_download(full_pdf_url, pdf_filename)
+                    downloads.append((article, full_pdf_url, pdf_filename, future))
+                    # Links on the page come before custom-element (related card) links
+                    if self.ONLY_PRIMARY_PDF:
+                        break
+            except Exception as e:
+                print(f"Error processing PDF link: {e}")
+        return downloads
+
+    def _process_article_with_pooled_driver(self, article):
+        '''Runs process_article with a driver checked out of the article pool.'''
+        driver = self.article_drivers.get()
+        self._local.driver = driver
+        try:
+            return self.process_article(article)
+        finally:
+            self._local.driver = None
+            self.article_drivers.put(driver)
+
+    def _finish_page(self, page_num, page_articles, article_futures):
+        '''Waits for a results page's article visits and downloads, and records
+        metadata for the PDFs that were downloaded successfully.'''
+        page_downloads = []  # (article, pdf_url, filename, future) submitted for this page
+        articles_with_failures = set()
+        for article, article_future in zip(page_articles, article_futures):
+            # One failed article visit must not take down the rest of the page
+            try:
+                page_downloads.extend(article_future.result())
+            except Exception as e:
+                print(f"Error processing article {article['url']}: {e}")
+                articles_with_failures.add(article['url'])
+
+        # Wait for this page's downloads and record metadata for the successful ones
+        articles_with_pdf = set()
+        article_rows = {article['url']: [] for article in page_articles}
+        for article, full_pdf_url, pdf_filename, future in page_downloads:
+            try:
+                md5_hash = future.result()
+            except Exception as e:
+                print(f"Error downloading {full_pdf_url}: {e}")
+                md5_hash = None
+            if md5_hash:
+                metadata = {
+                    "source_page_url": article['url'],
+                    "pdf_url": full_pdf_url,
+                    "downloaded_filename": pdf_filename,
+                    "title": article['title'],
+                    "date": article['date'],
+                    "content_type": article['content_type'],
+                    "topic": article['topic'],
+                    "description": article['description'],
+                    "file_md5": md5_hash
+                }
+                self.all_metadata.append(metadata)
+                article_rows[article['url']].append(metadata)
+                articles_with_pdf.add(article['url'])
+            else:
+                articles_with_failures.add(article['url'])
+                print(f"    Failed to download {pdf_filename}")
+        finished_articles = {}
+        for article in page_articles:
+            if article['url'] not in articles_with_pdf:
+                print(
+                    "No PDF download link found on article page: "
+                    f"{article['url']}"
+                )
+            # Articles with a failed download are left out so the next run retries them
+            if article['url'] not in articles_with_failures:
+                finished_articles[article_url_key(article['url'])] = article_rows[article['url']]
+        self.processed_articles.update(finished_articles)
+        self._append_processed_articles(finished_articles)
+        
+        #self.save_metadata_per_page([row for rows in article_rows.values() for row in rows], page_num)
+
     def run(self) -> dict:
         """
         Main method to run the scraper.
@@ -703,8 +1295,8 @@ class NationalbankenScraper:
         Returns:
             A list of file paths for all created files.
         """
-        if not os.path.exists(self.DOCS_DIR):
-            os.makedirs(self.DOCS_DIR)
+        # Created once here; download_pdf and save_metadata_per_page rely on it
+        os.makedirs(self.DOCS_DIR, exist_ok=True)
 
         page_num = 1
         first_page = True
@@ -712,230 +1304,131 @@ class NationalbankenScraper:
         if not self.driver:
             print_dlz("WebDriver not initialized. Exiting.")
             return {}
-            
-        while True:
-            if page_num > self.MAX_PAGES_TO_SCRAPE:
-                print_dlz(f"Reached max page limit ({self.MAX_PAGES_TO_SCRAPE}), stopping.")
-                break
 
-            current_search_url = f"{self.START_URL}?page={page_num}" if page_num > 1 else self.START_URL
-            print_dlz(f"Processing search page: {current_search_url}")
+        # Open a connection to the site in the background while the browser loads the
+        # first listing, so the first PDF download does not pay for the TLS handshake
+        self.download_pool.submit(self.session.head, self.BASE_URL, allow_redirects=False, timeout=10)
             
-            # Load the search page
-            self.driver.get(current_search_url)
-            time.sleep(3)
+        pending_page = None  # (page_num, page_articles, article_futures) still being processed
+        with ThreadPoolExecutor(max_workers=self.article_drivers.qsize()) as article_pool:
+            while True:
+                if page_num > self.MAX_PAGES_TO_SCRAPE:
+                    print_dlz(f"Reached max page limit ({self.MAX_PAGES_TO_SCRAPE}), stopping.")
+                    break
+
+                current_search_url = f"{self.START_URL}?page={page_num}" if page_num > 1 else self.START_URL
+                print_dlz(f"Processing search page: {current_search_url}")
             
-            # Accept cookies if needed
-            if page_num == 1 or first_page:
-                self.accept_cookies()
+                # Load the search page
+                self.driver.get(current_search_url)
+                self.wait_for_shadow_element("dnb-search-result-item")
             
-            # Find search result items in shadow DOM
-            result_items = self.find_elements_in_all_shadow_roots("dnb-search-result-item")
+                # Accept cookies if needed
+                if page_num == 1 or first_page:
+                    self.accept_cookies()
             
-            if not result_items:
-                if page_num == 1:
-                    print("No search results found on the first page. Exiting.")
-                else:
-                    print("No more search results found. End of results.")
-                break
-            print(f"Found {len(result_items)} search result items on page {page_num}")
+                # Find search result items in shadow DOM, together with their attributes
+                result_items = self.find_attributes_in_all_shadow_roots("dnb-search-result-item")
             
-            # First, extract all article data and URLs from the search page
-            page_articles = []
-            found_new_articles_on_page = False
+                if not result_items:
+                    if page_num == 1:
+                        print("No search results found on the first page. Exiting.")
+                    else:
+                        print("No more search results found. End of results.")
+                    break
+                print(f"Found {len(result_items)} search result items on page {page_num}")
             
-            # Store the metadata for each page separately
-            page_metadata = []
+                # First, extract all article data and URLs from the search page
+                page_articles = []
+                found_new_articles_on_page = False
             
-            print_dlz("Extracting article metadata from search results...")
-            for item in result_items:
-                # Extract attributes from the shadow DOM element
-                attrs = self.extract_attributes_from_shadow_element(item)
+                print_dlz("Extracting article metadata from search results...")
+                for attrs in result_items:
                 
-                # Get article information
-                article_title = attrs.get('header', 'N/A').strip()
-                content_type = attrs.get('content-type', '')
-                topic = attrs.get('topic', '')
-                date = attrs.get('date', '')
-                description = attrs.get('description', '')
+                    # Get article information
+                    article_title = attrs.get('header', 'N/A').strip()
+                    content_type = attrs.get('content-type', '')
+                    topic = attrs.get('topic', '')
+                    date = attrs.get('date', '')
+                    description = attrs.get('description', '')
                 
-                # Extract URL from link attribute (which is a JSON string)
-                link_json_str = attrs.get('link', '{}')
-                article_url = None
+                    # Extract URL from link attribute (which is a JSON string)
+                    link_json_str = attrs.get('link', '{}')
+                    article_url = None
                 
-                try:
-                    link_data = json.loads(link_json_str)
-                    raw_url = link_data.get('url')
-                    if (raw_url):
-                        article_url = urljoin(self.BASE_URL, raw_url)
-                except json.JSONDecodeError:
-                    print(f"  Error decoding link JSON for item '{article_title}': {link_json_str}")
-                
-                # If no URL found, skip this item
-                if not article_url:
-                    print(f"Could not find a valid URL for item: {article_title}")
-                    continue
-                
-                # Skip if already processed
-                if article_url in self.processed_article_urls:
-                    print(f"  Skipping already processed article: {article_title}")
-                    continue
-                
-                # Store the article metadata for later processing
-                page_articles.append({
-                    'url': article_url,
-                    'title': article_title,
-                    'content_type': content_type,
-                    'topic': topic,
-                    'date': date,
-                    'description': description
-                })
-                found_new_articles_on_page = True
-
-            print_dlz(f"Articles found on page: {[a['url'] for a in page_articles]}")
-
-            # Now visit each article URL one by one
-            for article in page_articles:
-                article_url = article['url']
-                article_title = article['title']
-                
-                self.processed_article_urls.add(article_url)
-                print(f"  Visiting article page: {article_title} ({article_url})")
-                # Load the article page
-                self.driver.get(article_url)
-
-                WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.CLASS_NAME, "h2"))
-                )
-                time.sleep(2)  # Wait for page to load
-                
-                # Analyze the shadow DOM structure to better understand the page
-                shadow_structure = self.analyze_shadow_dom_structure()
-                
-                # First try to use the PDF links we found from our shadow DOM analysis
-                pdf_links = []
-                pdf_links_from_analysis = shadow_structure.get('pdfLinks', [])
+                    try:
+                        link_data = orjson.loads(link_json_str)
+                        raw_url = link_data.get('url')
+                        if (raw_url):
+                            article_url = urljoin(self.BASE_URL, raw_url)
+                    except orjson.JSONDecodeError:
+                        print(f"  Error decoding link JSON for item '{article_title}': {link_json_str}")
                 
-                if pdf_links_from_analysis:
-                    #print(f"Found {len(pdf_links_from_analysis)} PDF links from shadow DOM analysis")
-                    
-                    # Convert the analyzed links to objects that can be used like WebElements
-                    for link_info in pdf_links_from_analysis:
-                        href = link_info.get('href')
-                        if href and (href.lower().endswith('.pdf') or link_info.get('hasDownload')):
-                            # Create a dictionary that mimics a WebElement with properties we need
-                            link_obj = {
-                                'href': href,
-                                'text': link_info.get('text'),
-                                'getAttribute': lambda attr, h=href: h if attr == 'href' else None
-                            }
-                            pdf_links.append(link_obj)
+                    # If no URL found, skip this item
+                    if not article_url:
+                        print(f"Could not find a valid URL for item: {article_title}")
+                        continue
                 
-                # If no PDF links found through analysis, try regular DOM
-                if not pdf_links:
-                    regular_pdf_links = self.driver.find_elements(By.CSS_SELECTOR, "a.related-card__link[download], a[href$='.pdf']")
-                    
-                    if regular_pdf_links:
-                        pdf_links = regular_pdf_links
-                    else:
-                        # If still nothing found, try our custom shadow DOM search
-                        shadow_selectors = [
-                            "a.related-card__link[download]",
-                            "a.related-card__link[href$='.pdf']",
-                            "a[download]", 
-                            "a[href$='.pdf']",
-                            "a[href*='.pdf']"
-                        ]
-                        
-                        for selector in shadow_selectors:
-                            pdf_links_in_shadow = self.find_elements_in_all_shadow_roots(selector)
-                            if pdf_links_in_shadow:
-                                pdf_links = pdf_links_in_shadow
-                                break
+                    # Skip if already processed, either earlier in this run or on this page
+                    article_key = article_url_key(article_url)
+                    if article_key in self.processed_article_urls:
+                        print(f"  Skipping already processed article: {article_title}")
+                        continue
+                    self.processed_article_urls.add(article_key)
+
+                    # Articles fully processed by an earlier run keep their metadata without a visit
+                    if article_key in self.processed_articles:
+                        print(f"  Reusing metadata from an earlier run for article: {article_title}")
+                        self.all_metadata.extend(self.processed_articles[article_key])
+                        found_new_articles_on_page = True
+                        continue
                 
-                custom_pdf_links = self.extract_pdf_links_from_custom_elements()
-                
-                all_pdf_links = []
-                if pdf_links:
-                    all_pdf_links.extend(pdf_links)
-                if custom_pdf_links:
-                    for link in custom_pdf_links:
-                        href = link.get('href')
-                        if href and not any((isinstance(l, dict) and l.get('href') == href) or (hasattr(l, 'get_attribute') and l.get_attribute('href') == href) for l in all_pdf_links):
-                            all_pdf_links.append(link)
-
-                #print_dlz(f"Found {len(all_pdf_links)} total potential PDF links")
-
-                pdf_found_for_article = False
-                for pdf_link in all_pdf_links:
-                    try:
-                        pdf_href = None
-                        if isinstance(pdf_link, dict) and 'href' in pdf_link:
-                            pdf_href = pdf_link['href']
-                            print(f"Processing PDF link: {pdf_href}")
-                        elif hasattr(pdf_link, 'get_attribute'):
-                            pdf_href = pdf_link.get_attribute('href')
-                            if not pdf_href:
-                                pdf_href = self.driver.execute_script("return arguments[0].href || arguments[0].getAttribute('href');", pdf_link)
-                        else:
-                            try:
-                                pdf_href = self.driver.execute_script("return arguments[0].href || arguments[0].getAttribute('href');", pdf_link)
-                            except Exception:
-                                print(f"    Cannot extract href from {type(pdf_link)}")
-                        if pdf_href and pdf_href.lower().endswith(".pdf"):
-                            full_pdf_url = urljoin(self.BASE_URL, pdf_href)
-                            parsed_pdf_url = urlparse(full_pdf_url)
-                            pdf_filename = os.path.basename(parsed_pdf_url.path)
-                            if not pdf_filename:
-                                print(f"Could not determine filename for PDF: {full_pdf_url}")
-                                continue
-                            print(f"Found PDF: {full_pdf_url}")
-                            md5_hash = self.download_pdf(full_pdf_url, pdf_filename)
-                            if md5_hash:
-                                metadata = {
-                                    "source_page_url": article_url,
-                                    "pdf_url": full_pdf_url,
-                                    "downloaded_filename": pdf_filename,
-                                    "title": article['title'],
-                                    "date": article['date'],
-                                    "content_type": article['content_type'],
-                                    "topic": article['topic'],
-                                    "description": article['description'],
-                                    "file_md5": md5_hash
-                                }
-                                self.all_metadata.append(metadata)
-                                page_metadata.append(metadata)
-                                pdf_found_for_article = True
-                            else:
-                                print(f"    Failed to download {pdf_filename}")
-                    except Exception as e:
-                        print(f"Error processing PDF link: {e}")
-                if not pdf_found_for_article:
+                    # Store the article metadata for later processing
+                    page_articles.append({
+                        'url': article_url,
+                        'title': article_title,
+                        'content_type': content_type,
+                        'topic': topic,
+                        'date': date,
+                        'description': description
+                    })
+                    found_new_articles_on_page = True
+
+                print_dlz(f"Articles found on page: {[a['url'] for a in page_articles]}")
+
+                # Start visiting this page's articles, then finish the previous page, whose
+                # articles were being visited while this listing loaded
+                article_futures = [
+                    article_pool.submit(self._process_article_with_pooled_driver, article)
+                    for article in page_articles
+                ]
+                if pending_page:
+                    self._finish_page(*pending_page)
+                pending_page = (page_num, page_articles, article_futures)
+                # Without extra drivers the main driver is busy with articles, so the next
+                # listing has to wait until they are done
+                if not self.extra_drivers:
+                    self._finish_page(*pending_page)
+                    pending_page = None
+
+                if not found_new_articles_on_page and page_num > 1:
                     print(
-                        "No PDF download link found on article page: "
-                        f"{article_url}"
+                        "No new articles found on this page, stopping pagination."
                     )
+                    break
             
-            #self.save_metadata_per_page(page_metadata, page_num)
-            
-            if not found_new_articles_on_page and page_num > 1:
-                print(
-                    "No new articles found on this page, stopping pagination."
-                )
-                break
-            
-            page_num += 1
-            first_page = False
+                page_num += 1
+                first_page = False
+
+            if pending_page:
+                self._finish_page(*pending_page)
 
-        print(
-            "Browser window left open for inspection. "
-            "Close it manually when done."
-        )
         return self.files_to_send
 
 
 def main():
     """Main function to run the scraper."""
+    _ensure_env()
     with NationalbankenScraper() as scraper:
         scraper.run()
     files_to_send = scraper.files_to_send  # Collect after context manager